@@ -2,12 +2,20 @@
 Camera streaming module that handles continuous frame capture in a background thread.
 Uses QThread to stream frames from a Ximea camera without blocking the UI.
 Emits signals when new frames are ready for display.
+
+xiAPI has no pollable frame-ready event that a QSocketNotifier could watch, so
+frames are read by a thread blocked in get_image(). The call goes through ctypes,
+which releases the GIL while waiting. get_image() holds CameraControl.image_lock
+rather than camera_lock, so queued camera commands from the UI thread still run
+while the capture thread waits for a frame.
 """
 
 from PyQt6.QtCore import QObject, pyqtSignal, QThread
-import queue
+import logging
 import time
 
+logger = logging.getLogger(__name__)
+
 class CameraThread(QThread):
     """
     Handles continuous camera frame capture in a background thread.
@@ -32,25 +40,35 @@ class CameraThread(QThread):
         super().__init__()
         self.camera_control = camera_control
         self.running = True
-        self.frame_Hz = 60  # Fixed 60 Hz (1000ms/60 ≈ 16.67ms)
 
     def run(self):
         
-        """Main thread loop"""
+        """Main thread loop, paced by the camera delivering frames rather than a sleep"""
+        last_frame_time = None  # None until the first frame, and again after an error back-off
+        
         while self.running:
             try:
-                time.sleep(1/self.frame_Hz) # Sleep for the appropriate amount of time to achieve the desired frame rate
-                
-                """Get image from camera"""
+                """Get image from camera, get_image() blocks in the SDK until the next frame arrives"""
                 self.camera_control.get_image()
                 image_data = self.camera_control.get_image_data()
+                frame_time = time.monotonic()
+                
+                """Report frame intervals longer than two periods of the programmed framerate"""
+                framerate = self.camera_control.framerate  # Kept current by the framerate setter, no camera round trip
+                if last_frame_time is not None and framerate:
+                    interval = frame_time - last_frame_time
+                    if interval > 2 / framerate:
+                        logger.warning("Frame interval %.1f ms exceeds twice the %.1f ms frame period, frames dropped",
+                                       interval * 1000, 1000 / framerate)
+                last_frame_time = frame_time
                 
                 if image_data is not None:
                     self.frame_captured.emit(image_data)
                 
-            except Exception as e:
-                print(f"Error in camera thread: {str(e)}")
+            except Exception:
+                logger.exception("Error in camera thread")
                 time.sleep(0.1)  # Sleep briefly on error to prevent hammering the CPU on error
+                last_frame_time = None  # The back-off is not a late frame
     
     def stop(self):
         
@@ -61,6 +79,9 @@ class CameraThread(QThread):
 class StreamCamera(QObject):
     """
     Manages camera streaming with frame buffering and thread control.
+    Frames are double buffered: each new frame is stored in the back slot,
+    which then becomes the front slot read by get_latest_frame(). xiAPI returns
+    a new array for every frame, so the slots hold references and never copy.
     
     Called by:
     - interface/ui_methods.py: UIMethods uses StreamCamera for live display
@@ -74,7 +95,10 @@ class StreamCamera(QObject):
         # ... later ...
         stream.stop_stream()
     """
-    frame_available = pyqtSignal() # Signal to emit when a new frame is available in the queue
+    frame_available = pyqtSignal() # Signal to emit when a new frame is available in the buffer
+    
+    # Framerate the camera paces the live stream at, it used to be paced at 60 Hz by a sleep
+    STREAM_FRAMERATE_HZ = 60.0
     
     def __init__(self, camera_control):
         
@@ -82,8 +106,11 @@ class StreamCamera(QObject):
         super().__init__()
         self.camera_control = camera_control
         self.camera = None
-        self.streaming_queue = queue.Queue(maxsize=1)  # Buffer for frames
+        self._buffers = [None, None]  # The two most recent frames
+        self._latest = None  # Index of the slot holding the latest frame
+        self._frame_pending = False  # True when the latest frame has not yet been read
         self.camera_thread = None
+        self._stopped = True  # Guards against stopping the thread and camera twice
 
     def start_stream(self):
         
@@ -91,9 +118,11 @@ class StreamCamera(QObject):
         if self.camera_thread is None or not self.camera_thread.isRunning():
             self.camera_thread = CameraThread(self.camera_control)
             self.camera_thread.frame_captured.connect(self._handle_frame)
+            self._stopped = False
+            self.camera_control.set_framerate_pacing(self.STREAM_FRAMERATE_HZ)
             self.camera_control.start_camera()
             self.camera_thread.start()
-            print("StreamCamera.start_stream(): Camera stream started.")
+            logger.debug("Camera stream started")
 
     def _handle_frame(self, image_data):
         """Handle a new frame from the camera thread with throttling"""
@@ -103,42 +132,47 @@ class StreamCamera(QObject):
         if not hasattr(self, '_last_frame_time') or (current_time - self._last_frame_time) >= 0.033:
             self._last_frame_time = current_time
             
-            # Process frame as normal
+            # Store the frame in the back slot, then make it the front slot
             try:
-                if not self.streaming_queue.full():
-                    self.streaming_queue.put(image_data)
-                    self.frame_available.emit()
-            except Exception as e:
-                print(f"Error handling frame: {str(e)}")
+                back = 0 if self._latest is None else self._latest ^ 1
+                self._buffers[back] = image_data
+                self._latest = back
+                self._frame_pending = True
+                self.frame_available.emit()
+            except Exception:
+                logger.exception("Error handling frame")
 
     def stop_stream(self):
         
         """Stop the frame capture thread."""
+        if self._stopped:
+            return
+        self._stopped = True
         try:
             if hasattr(self, 'camera_thread') and self.camera_thread is not None:
                 if self.camera_thread.isRunning():
                     self.camera_thread.stop()
                 self.camera_thread = None
-            print("StreamCamera.stop_stream(): Camera stream stopped.")
+            logger.debug("Camera stream stopped")
             self.camera_control.stop_camera()
+            self.camera_control.clear_framerate_pacing()
         except RuntimeError:
             # Ignore errors if the thread has already been deleted
             pass
 
     def get_latest_frame(self):
         
-        """Retrieve the latest frame from the queue."""
-        if not self.streaming_queue.empty():
-            return self.streaming_queue.get()
-        return None
+        """Retrieve the latest frame from the buffer, or None if it has already been read."""
+        if not self._frame_pending:
+            return None
+        self._frame_pending = False
+        return self._buffers[self._latest]
 
     def cleanup(self):
         
         """Clean up resources before deletion"""
         self.stop_stream()
-        """Clear the queue"""
-        while not self.streaming_queue.empty():
-            try:
-                self.streaming_queue.get_nowait()
-            except queue.Empty:
-                break
\ No newline at end of file
+        """Release the stored frames"""
+        self._buffers = [None, None]
+        self._latest = None
+        self._frame_pending = False
\ No newline at end of file
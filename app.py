@@ -1,14 +1,19 @@
 import sys
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import Qt
 from interface.ui import ui
 from interface.ui_methods import UIMethods
 from instruments.xicam.cam_methods import CameraControl, CameraSequences
 from acquisitions.stream_camera import StreamCamera
 from utils.status import set_main_window
+from utils import start_logging, stop_logging
 
 class microTool():
     def __init__(self):
+        """Logging, written from a background thread so the camera thread never blocks on console output"""
+        start_logging()
+        self._cleaned = False
+        
         """UI Window"""
         self.app = QApplication(sys.argv)
         self.window = ui()
@@ -28,14 +33,10 @@ class microTool():
         """Set the main window"""
         set_main_window(self.window)
 
-        # Create a timer to update UI at a reasonable rate
-        self.ui_update_timer = QTimer()
-        self.ui_update_timer.timeout.connect(self.ui_methods.update_ui_image)
-        self.ui_update_timer.start(33)  # ~30 FPS for UI updates
-        
-        # Disconnect direct connection
-        # """Connect the stream to update the image display"""
-        # self.stream_camera.frame_available.connect(self.ui_methods.update_ui_image)
+        """Connect the stream to update the image display"""
+        # StreamCamera lives on the GUI thread and receives frames from the camera thread through a queued
+        # connection, so frame_available is emitted on the GUI thread and can call the slot directly
+        self.stream_camera.frame_available.connect(self.ui_methods.update_ui_image, Qt.ConnectionType.DirectConnection)
 
         """Connect the window close event to our cleanup method"""
         self.window.closeEvent = self.cleanup
@@ -48,6 +49,10 @@ class microTool():
     
     """Clean up resources before the application closes."""
     def cleanup(self, event):
+        if self._cleaned:
+            event.accept()
+            return
+        self._cleaned = True
         try:
             if hasattr(self, 'stream_camera'):
                 self.stream_camera.cleanup()
@@ -55,6 +60,7 @@ class microTool():
                 self.camera_sequences.disconnect_camera()
             event.accept()
             print("microTool.cleanup(): Resources cleaned up.")
+            stop_logging()
         except Exception as e:
             print(f"Error during cleanup: {e}")
             event.accept()
@@ -62,17 +68,6 @@ class microTool():
     def run(self):
         self.window.show()
         sys.exit(self.app.exec())
-        
-    def __del__(self):
-        """Backup cleanup method, but closeEvent handler is the primary cleanup method"""
-        try:
-            if hasattr(self, 'stream_camera'):
-                self.stream_camera.cleanup()
-            if hasattr(self, 'camera_sequences'):
-                self.camera_sequences.disconnect_camera()
-            print("microTool.__del__(): Resources cleaned up.")
-        except Exception as e:
-            print(f"Error during __del__ cleanup: {e}")
 
 if __name__ == "__main__":
     app = microTool()
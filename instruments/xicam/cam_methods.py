@@ -63,8 +63,11 @@ class CameraControl:
         self.get_commands_by_name = {}
         self.command_queue = Queue()
         self.camera_lock = Lock()
+        self.image_lock = Lock()  # Guards self.image, kept apart from camera_lock so commands run while get_image() waits for a frame
         self.command_thread = None
         self.running = True
+        self.framerate_target = None  # Framerate the camera is paced at, None while it free-runs
+        self.framerate = None  # Pacing framerate read back from the camera, used by CameraThread to spot late frames
         
     def _load_commands(self):
        
@@ -224,11 +227,49 @@ class CameraControl:
         else:
             print("CameraControl.start_camera(): Camera failed to start acquisition.")
     
+    def set_framerate_pacing(self, target_framerate):
+        
+        """Let the camera pace acquisition at a fixed framerate, get_image() then blocks until each frame is due."""
+        self.call_camera_command("acq_timing_mode", "set", "XI_ACQ_TIMING_MODE_FRAME_RATE")
+        timing_mode = self.call_camera_command("acq_timing_mode", "get")
+        if timing_mode != "XI_ACQ_TIMING_MODE_FRAME_RATE":
+            print(f"CameraControl.set_framerate_pacing(): Camera did not enter framerate timing mode (got {timing_mode}).")
+            return False
+        self.framerate_target = target_framerate
+        self.clamp_framerate()
+        return True
+    
+    def clamp_framerate(self):
+        
+        """Program the pacing framerate, limited to what the camera supports at the current exposure."""
+        if self.framerate_target is None:
+            return
+        target_framerate = self.framerate_target
+        framerate_max = self.call_camera_command("framerate_max", "get")
+        if framerate_max:
+            target_framerate = min(target_framerate, framerate_max)
+        self.call_camera_command("framerate", "set", target_framerate)
+        self.framerate = self.call_camera_command("framerate", "get")
+        print(f"CameraControl.clamp_framerate(): Framerate set to {self.framerate} Hz.")
+    
+    def clear_framerate_pacing(self):
+        
+        """Return the camera to free-run, so recordings and snapshots are not capped at the stream framerate."""
+        if self.framerate_target is None:
+            return
+        self.framerate_target = None
+        self.framerate = None
+        self.call_camera_command("acq_timing_mode", "set", "XI_ACQ_TIMING_MODE_FREE_RUN")
+        """Read the mode back so the change has run before acquisition is restarted"""
+        timing_mode = self.call_camera_command("acq_timing_mode", "get")
+        if timing_mode != "XI_ACQ_TIMING_MODE_FREE_RUN":
+            print(f"CameraControl.clear_framerate_pacing(): Camera did not return to free-run (got {timing_mode}).")
+    
     def get_image(self):
         
-        """Get an image from the camera."""
+        """Get an image from the camera, blocking until the next frame arrives."""
         if self.image:
-            with self.camera_lock:
+            with self.image_lock:
                 return self.camera.get_image(self.image)
         else:
             print("CameraControl.get_image(): Image object doesn't exist.")
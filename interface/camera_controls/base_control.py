@@ -6,6 +6,10 @@ from abc import ABC, abstractmethod
 
 class CameraControl(ABC):
     """Base class for all camera controls."""
+    
+    # Quiet period after the last value change before the pending value is sent to the camera
+    DEBOUNCE_MS = 50
+    
     def __init__(self, camera_control, window):
         print(f"Initializing base camera control")  # Debug print
         self.camera_control = camera_control
@@ -71,7 +75,7 @@ class NumericCameraControl(CameraControl):
         """Queue value change with debouncing."""
         print(f"{self.display_name} value change queued: {value}")  # Debug print
         self.pending_value = value
-        self.control_timer.start(50)  # 50ms debounce
+        self.control_timer.start(self.DEBOUNCE_MS)  # Restart the debounce, only the latest value is applied
         
     def _apply_change(self):
         """Apply the pending change to the camera."""
@@ -105,6 +105,8 @@ class ExposureControl(NumericCameraControl):
             try:
                 self.camera_control.call_camera_command(self.command_name, "set", self.pending_value)
                 print("Successfully applied exposure value")  # Debug print
+                # The maximum framerate depends on exposure, so re-clamp the stream pacing
+                self.camera_control.clamp_framerate()
                 self._format_and_update_label(int(round(self.pending_value)))
                 
                 # Update status bar
@@ -1,4 +1,6 @@
 """Controls for camera Region of Interest (ROI) settings - width, height, and offsets."""
+from PyQt6.QtCore import QSignalBlocker
+
 from .base_control import NumericCameraControl
 
 class ROIControl(NumericCameraControl):
@@ -72,6 +74,37 @@ class ROIControl(NumericCameraControl):
             print(f"Error setting up ROI controls: {str(e)}")
             return False
     
+    def reset_roi(self):
+        """Reset the ROI to the full sensor.
+        
+        The full size comes from the dimensions cached in setup_ui, or is read
+        from the camera if they are missing, before anything is changed. The
+        camera is then set directly, offsets first. The spinboxes are updated
+        last with their signals blocked so handle_roi_change doesn't run once
+        per value.
+        """
+        if self.max_dimensions is None:
+            width_max = self.camera_control.call_camera_command("width_max", "get")
+            height_max = self.camera_control.call_camera_command("height_max", "get")
+            if width_max is None or height_max is None:
+                print("Error resetting ROI: could not read the maximum dimensions, camera left unchanged")
+                return
+            self.max_dimensions = {'width': int(width_max), 'height': int(height_max)}
+        
+        for name in ('offset_x', 'offset_y'):
+            self.camera_control.call_camera_command(self.controls[name][1], "set", 0)
+        for name in ('width', 'height'):
+            self.camera_control.call_camera_command(self.controls[name][1], "set", self.max_dimensions[name])
+        
+        with QSignalBlocker(self.window.roi_width), QSignalBlocker(self.window.roi_height), \
+                QSignalBlocker(self.window.roi_offset_x), QSignalBlocker(self.window.roi_offset_y):
+            for name, offset_name in (('width', 'offset_x'), ('height', 'offset_y')):
+                self.controls[offset_name][0].setValue(0)
+                self.controls[name][0].setMaximum(self.max_dimensions[name])
+                self.controls[name][0].setValue(self.max_dimensions[name])
+                # The full size leaves no room to move the offset
+                self.controls[offset_name][0].setMaximum(0)
+    
     def _validate_value(self, name: str, value: int, increment: int) -> int:
         """Validate and adjust ROI values."""
         # Align to increment
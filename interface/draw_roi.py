@@ -1,5 +1,4 @@
 from PyQt6.QtCore import Qt, QRect, QPoint
-from PyQt6.QtGui import QPainter, QPen, QColor
 
 class DrawROI:
     def __init__(self):
@@ -31,7 +30,7 @@ class DrawROI:
             start_point = QPoint(int(self.start_point[0]), int(self.start_point[1]))
             end_point = QPoint(int(self.end_point[0]), int(self.end_point[1]))
             self.current_rect = QRect(start_point, end_point).normalized()
-            image_label.update()
+            self.draw_rectangle(image_label)
 
     def mouseReleaseEvent(self, event, image_label):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -41,7 +40,7 @@ class DrawROI:
             start_point = QPoint(int(self.start_point[0]), int(self.start_point[1]))
             end_point = QPoint(int(self.end_point[0]), int(self.end_point[1]))
             self.current_rect = QRect(start_point, end_point).normalized()
-            image_label.update()
+            self.draw_rectangle(image_label)
 
     def map_to_image_coordinates(self, pos, image_label):
         """Convert widget coordinates to image coordinates"""
@@ -69,13 +68,9 @@ class DrawROI:
         
         return image_x, image_y
 
-    def draw_rectangle(self, painter, image_label):
-        """Draw the current rectangle on the image"""
+    def draw_rectangle(self, image_view):
+        """Move the view's ROI rectangle item over the current rectangle, or hide it if there is none"""
         if self.current_rect:
-            pen = QPen(QColor(255, 0, 0))  # Red color for the rectangle
-            pen.setWidth(2)
-            painter.setPen(pen)
-            
             # Get coordinates from QPoint objects
             top_left = self.current_rect.topLeft()
             bottom_right = self.current_rect.bottomRight()
@@ -87,9 +82,12 @@ class DrawROI:
             widget_y2 = int(bottom_right.y() * self.scale_factor_y + self.offset_y)
             
             # Draw the rectangle
-            painter.drawRect(widget_x1, widget_y1, 
-                           widget_x2 - widget_x1, 
-                           widget_y2 - widget_y1)
+            image_view.roi_item.setRect(widget_x1, widget_y1, 
+                                        widget_x2 - widget_x1, 
+                                        widget_y2 - widget_y1)
+            image_view.roi_item.show()
+        else:
+            image_view.roi_item.hide()
 
     def update_scale_and_offset(self, scale_factor_x, scale_factor_y, offset_x, offset_y, scaled_width, scaled_height, original_width, original_height):
         """Update the scaling and offset values"""
@@ -4,37 +4,65 @@ Handles layout, controls, and image display components using PyQt6.
 Provides ROI drawing capabilities and histogram visualization.
 """
 
-from PyQt6.QtWidgets import QMainWindow, QLabel, QWidget, QSlider, QHBoxLayout, QSizePolicy, QSpinBox, QGroupBox, QVBoxLayout, QFormLayout, QToolBar, QStatusBar, QPushButton
-from PyQt6.QtGui import QAction, QPainter
+from PyQt6.QtWidgets import QMainWindow, QLabel, QWidget, QSlider, QHBoxLayout, QSizePolicy, QSpinBox, QGroupBox, QVBoxLayout, QFormLayout, QToolBar, QStatusBar, QPushButton, QFrame, QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QGraphicsRectItem
+from PyQt6.QtGui import QAction, QPen, QColor, QPalette
 from PyQt6.QtCore import Qt
 import qtawesome as qta
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+import pyqtgraph as pg
+import numpy as np
 import json, os
+from functools import lru_cache
 
-class ImageLabel(QLabel):
+@lru_cache(maxsize=None)
+def _load_json_cached(file_path):
+    
+    """Parse a JSON file from the interface folder once and reuse the result"""
+    with open(os.path.join('interface', file_path), 'rb') as f:
+        return json.load(f)
+
+class ImageView(QGraphicsView):
     """
-    Custom QLabel subclass for handling ROI drawing interactions.
-    Manages mouse events and painting for region of interest selection.
+    Custom QGraphicsView subclass for displaying camera frames and handling ROI drawing interactions.
+    The frame is a pixmap item and the ROI a separate rectangle item, so Qt only repaints
+    the region that changed. The scene rectangle tracks the viewport, so scene coordinates
+    are the same as widget coordinates.
     
     Called by:
-    - interface/ui.py: Main UI creates ImageLabel for camera display
-    - interface/ui_methods.py: UIMethods handles the mouse/paint events
+    - interface/ui.py: Main UI creates ImageView for camera display
+    - interface/ui_methods.py: UIMethods handles the mouse/resize/paint events
     
     Example usage:
-        image_container = ImageLabel()
+        image_container = ImageView()
         image_container.ui_methods = ui_methods  # Connect UI methods
-        image_container.setPixmap(camera_frame)  # Display camera frame
+        image_container.pixmap_item.setPixmap(camera_frame)  # Display camera frame
         # ROI drawing handled automatically via mouse events
     """
 
     #    TODO: Should we move this to ui_methods?
     def __init__(self, parent=None):
         
-        """Initialize the ImageLabel"""
+        """Initialize the ImageView"""
         super().__init__(parent)
         self.setMouseTracking(True)
         self.ui_methods = None
+        
+        """Show the scene 1:1 with no frame or scroll bars, over the window background"""
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setBackgroundBrush(self.palette().brush(QPalette.ColorRole.Window))
+        
+        """Scene with the camera frame and the ROI rectangle on top"""
+        self.image_scene = QGraphicsScene(self)
+        self.setScene(self.image_scene)
+        self.pixmap_item = QGraphicsPixmapItem()
+        self.image_scene.addItem(self.pixmap_item)
+        self.roi_item = QGraphicsRectItem()
+        roi_pen = QPen(QColor(255, 0, 0))  # Red color for the rectangle
+        roi_pen.setWidth(2)
+        self.roi_item.setPen(roi_pen)
+        self.roi_item.hide()
+        self.image_scene.addItem(self.roi_item)
 
     def mousePressEvent(self, event):
         
@@ -54,14 +82,20 @@ class ImageLabel(QLabel):
         if self.ui_methods:
             self.ui_methods.handle_mouse_release(event)
 
+    def resizeEvent(self, event):
+        
+        """Handle resize events"""
+        super().resizeEvent(event)
+        self.image_scene.setSceneRect(0, 0, self.viewport().width(), self.viewport().height())
+        if self.ui_methods:
+            self.ui_methods.handle_resize(event)
+
     def paintEvent(self, event):
         
         """Handle paint events"""
         super().paintEvent(event)
         if self.ui_methods:
-            painter = QPainter(self)
-            self.ui_methods.handle_paint(painter)
-            painter.end()
+            self.ui_methods.handle_paint()
 
 class ui(QMainWindow):
     """
@@ -96,8 +130,7 @@ class ui(QMainWindow):
     def load_json(self, file_path):
         
         """Load settings from ui_settings.json"""
-        with open(os.path.join('interface', file_path), 'r') as f:
-            return json.load(f)
+        return _load_json_cached(file_path)
 
     # def apply_styles(self):
         
@@ -117,10 +150,9 @@ class ui(QMainWindow):
         controls_layout = QHBoxLayout(controls_container)
 
         """Camera Image Container"""
-        self.image_container = ImageLabel(self)
+        self.image_container = ImageView(self)
         image_scaffolding = self.ui_scaffolding['image_display']
         self.image_container.setMinimumSize(image_scaffolding['min_width'], image_scaffolding['min_height'])
-        self.image_container.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         """ROI Group Box"""
         roi_group = QGroupBox("Region of Interest")
@@ -171,9 +203,20 @@ class ui(QMainWindow):
         right_layout = QVBoxLayout(right_column)
         
         """Histogram"""
-        self.hist_figure = plt.figure()
-        self.hist_display = FigureCanvas(self.hist_figure)
+        self.hist_display = pg.PlotWidget(background='#2f353c')
         self.hist_display.setFixedSize(512, 120)
+        self.hist_display.hideAxis('left')
+        self.hist_display.hideAxis('bottom')
+        self.hist_display.hideButtons()
+        self.hist_display.setMenuEnabled(False)
+        self.hist_display.setMouseEnabled(x=False, y=False)
+        self.hist_display.setXRange(0, 256, padding=0)
+        self.hist_display.getPlotItem().setContentsMargins(0, 0, 0, 0)
+        self.hist_curve = self.hist_display.plot(
+            np.arange(256), np.zeros(256),
+            pen=pg.mkPen('#97c1ff', width=1),
+            fillLevel=0, brush=pg.mkBrush(151, 193, 255, 51)  # Fill the area under the histogram line
+        )
         
         """Exposure Slider"""
         self.exposure_slider = QSlider(Qt.Orientation.Horizontal)
@@ -203,9 +246,12 @@ class ui(QMainWindow):
         toolbar = QToolBar("Main Toolbar")
         self.addToolBar(Qt.ToolBarArea.TopToolBarArea, toolbar)
 
-        """Add toolbar actions"""
+        """Add toolbar actions, reusing icons that appear more than once"""
+        icons = {}
         for action_name, action_data in self.ui_scaffolding['toolbar']['icons'].items():
-            action_obj = QAction(qta.icon(action_data['icon']), action_name, self)
+            if action_data['icon'] not in icons:
+                icons[action_data['icon']] = qta.icon(action_data['icon'])
+            action_obj = QAction(icons[action_data['icon']], action_name, self)
             action_obj.setToolTip(action_data['tooltip'])
             toolbar.addAction(action_obj)
             setattr(self, action_data['cmd'], action_obj)
\ No newline at end of file
@@ -3,8 +3,10 @@ UI methods for handling camera controls, ROI drawing, status updates, and image
 Manages interaction between UI components and camera functionality.
 """
 
-from PyQt6.QtGui import QImage, QPixmap, QPainter
-from PyQt6.QtCore import Qt, QObject
+from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtCore import QObject
+import numpy as np
+import cv2
 import time
 
 """ Import Classes """
@@ -24,7 +26,7 @@ class UIMethods(QObject):
     
     Called by:
     - app.py: Main application uses UIMethods for UI-camera interaction
-    - interface/image_container.py: ImageContainer uses UIMethods for display updates
+    - interface/ui.py: ImageView forwards its mouse, resize and paint events to UIMethods
     
     Example usage:
         window = ui()
@@ -32,6 +34,11 @@ class UIMethods(QObject):
         ui_methods = UIMethods(window, stream_camera)
         ui_methods.update_ui_image()  # Updates display with latest frame
     """
+    
+    # The histogram is only a rough guide, so refresh it at 10 Hz from every 4th pixel in each direction
+    HIST_INTERVAL_S = 0.1
+    HIST_STRIDE = 4
+    
     def __init__(self, window, stream_camera):
         
         """Initialize UI methods with window and camera objects."""
@@ -59,6 +66,24 @@ class UIMethods(QObject):
         
         """Set the original image size"""
         self.original_image_size = None
+        
+        """Cache the recording toolbar icons so they are not re-rendered on every toggle"""
+        recording_icons = self.window.ui_scaffolding['toolbar']['icons']['Start Recording']
+        self._icon_start_recording = qta.icon(recording_icons['icon'])
+        self._icon_stop_recording = qta.icon(recording_icons['Stop Recording']['icon'], color=recording_icons['Stop Recording']['icon_color'])
+        
+        """Cached display objects reused between frames"""
+        self._display_buf = None  # Preallocated buffer the frame is scaled into for display
+        self._display_qimage = None  # Long-lived QImage over _display_buf
+        self._frame_dtype = None  # dtype of the frames being displayed
+        self._bit_depth = 8  # Significant bits per pixel in the displayed frames
+        self._display_shift = 0  # Left shift that brings 10/12-bit pixels up to the full 16-bit display range
+        self._scaled_size = None  # (width, height) of the displayed image
+        self._roi_geometry = None  # Last scale and offset values passed to draw_roi
+        self._size_dirty = True  # Set when the image container is resized
+        self._scaled_pix = QPixmap()
+        self._last_hist_time = 0.0
+        self._paint_pending = False  # True from setPixmap() until the image container has painted it
 
     def handle_mouse_press(self, event):
         
@@ -75,10 +100,15 @@ class UIMethods(QObject):
         """Handle mouse release events for ROI drawing."""
         self.draw_roi.mouseReleaseEvent(event, self.window.image_container)
 
-    def handle_paint(self, painter):
+    def handle_resize(self, event):
         
-        """Handle paint events for ROI drawing."""
-        self.draw_roi.draw_rectangle(painter, self.window.image_container)
+        """Handle resize events by flagging the display geometry for recalculation."""
+        self._size_dirty = True
+
+    def handle_paint(self):
+        
+        """Handle paint events by marking the last frame as painted."""
+        self._paint_pending = False
     
     def handle_snapshot(self):
         
@@ -100,85 +130,113 @@ class UIMethods(QObject):
             # Start recording
             if self.record_stream.start_recording():
                 self.window.start_recording.is_recording = True
-                # Get the stop recording icon from JSON
-                stop_icon = self.window.ui_scaffolding['toolbar']['icons']['Start Recording']['Stop Recording']['icon']
-                icon_color = self.window.ui_scaffolding['toolbar']['icons']['Start Recording']['Stop Recording']['icon_color']
-                self.window.start_recording.setIcon(qta.icon(stop_icon, color=icon_color))
+                self.window.start_recording.setIcon(self._icon_stop_recording)
             else:
                 update_status("Failed to Start Recording", duration=2000)
         else:
             # Stop recording
             self.record_stream.stop_recording()
             self.window.start_recording.is_recording = False
-            # Get the start recording icon from JSON
-            start_icon = self.window.ui_scaffolding['toolbar']['icons']['Start Recording']['icon']
-            self.window.start_recording.setIcon(qta.icon(start_icon))
+            self.window.start_recording.setIcon(self._icon_start_recording)
             update_status("Recording Stopped", duration=2000)
     
     def update_ui_image(self):
         
         """Get the latest frame from the stream and update the UI image display."""
+        # Skip this update if the last frame has not been painted yet, the stream keeps overwriting
+        # its front buffer so the next update picks up the newest frame instead of a backlog
+        if self._paint_pending:
+            return
+        
         np_image_data = self.stream_camera.get_latest_frame()
         if np_image_data is None:
             return
         
-        # Cache the container size and check if it's changed
-        current_size = self.window.image_container.size()
-        size_changed = not hasattr(self, '_last_container_size') or self._last_container_size != current_size
-        self._last_container_size = current_size
-
+        height, width = np_image_data.shape
         
+        """Recalculate the display geometry only when the container is resized or the frame shape changes"""
+        if self._size_dirty or self.original_image_size != (width, height) or self._frame_dtype != np_image_data.dtype:
+            self._update_display_geometry(width, height, np_image_data.dtype)
         
-        # Only recalculate scaling if the image size or container has changed
-        if not hasattr(self, '_cached_image') or size_changed or self._cached_image_shape != np_image_data.shape:
-            self._cached_image_shape = np_image_data.shape
-            # Do the expensive scaling calculations here
-            """Update the main image display"""
-            height, width = np_image_data.shape
-            bytes_per_line = width
-            image_data = QImage(np_image_data.data, width, height, bytes_per_line, QImage.Format.Format_Grayscale8)
-            image = QPixmap(image_data)
-            
-            """Get container size"""
-            container_size = self.window.image_container.size()
-            
-            """Calculate scaling to fit the image while maintaining aspect ratio"""
-            scaled_image = image.scaled(container_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            
-            """Calculate the offset to center the image"""
-            offset_x = (container_size.width() - scaled_image.width()) // 2
-            offset_y = (container_size.height() - scaled_image.height()) // 2
-            
-            """Calculate the scale factors"""
-            scale_factor_x = scaled_image.width() / width
-            scale_factor_y = scaled_image.height() / height
-            
-            """Update the ROI drawing parameters"""
-            self.draw_roi.update_scale_and_offset(
-                scale_factor_x, scale_factor_y, 
-                offset_x, offset_y,
-                scaled_image.width(), scaled_image.height(),
-                width, height
-            )
-            
-            """Create a new pixmap for drawing"""
-            final_image = QPixmap(container_size)
-            final_image.fill(Qt.GlobalColor.transparent)
-            
-            """Draw the scaled image"""
-            painter = QPainter(final_image)
-            painter.drawPixmap(offset_x, offset_y, scaled_image)
-            
-            """Draw the ROI if any"""
-            self.draw_roi.draw_rectangle(painter, self.window.image_container)
-            painter.end()
-            
-            self.window.image_container.setPixmap(final_image)
-            self.original_image_size = (width, height)
+        """Scale once into the display buffer, nearest neighbour is fine for live preview"""
+        cv2.resize(np_image_data, self._scaled_size, dst=self._display_buf, interpolation=cv2.INTER_NEAREST)
+        if self._display_shift:
+            np.left_shift(self._display_buf, self._display_shift, out=self._display_buf)
+        self._scaled_pix = QPixmap.fromImage(self._display_qimage)
+        
+        """Display the scaled image, the ROI is a separate item drawn on top by the view"""
+        self._paint_pending = True
+        self.window.image_container.pixmap_item.setPixmap(self._scaled_pix)
 
-        """Update the image histogram"""
+        """Update the image histogram at a lower rate from a subsampled view of the frame"""
         # TODO: Should this be done here? Maybe a separate thread or multiprocessing?
-        calc_img_hist(self.window, np_image_data)
+        now = time.monotonic()
+        if now - self._last_hist_time >= self.HIST_INTERVAL_S:
+            calc_img_hist(self.window, np_image_data[::self.HIST_STRIDE, ::self.HIST_STRIDE], self._bit_depth)
+            self._last_hist_time = now
+    
+    def _update_display_geometry(self, width, height, dtype):
+        
+        """Recalculate the scaled size, offsets and display buffer for a frame of the given size and dtype."""
+        """Get container size"""
+        container_size = self.window.image_container.size()
+        
+        """Calculate the scaled size that fits the container while maintaining aspect ratio"""
+        scaled_width = max(1, min(container_size.width(), container_size.height() * width // height))
+        scaled_height = max(1, min(container_size.height(), container_size.width() * height // width))
+        self._scaled_size = (scaled_width, scaled_height)
+        
+        """Keep 10/12-bit frames at 16 bits until display, 8-bit frames are displayed as they are"""
+        if dtype != self._frame_dtype:
+            self._frame_dtype = dtype
+            self._bit_depth = 8 if dtype == np.uint8 else self._get_bit_depth()
+            self._display_shift = 16 - self._bit_depth if dtype == np.uint16 else 0
+        
+        """Reallocate the display buffer and its QImage only when the scaled size or dtype changes"""
+        if self._display_buf is None or self._display_buf.shape != (scaled_height, scaled_width) or self._display_buf.dtype != dtype:
+            self._display_buf = np.empty((scaled_height, scaled_width), dtype=dtype)
+            if dtype == np.uint16:
+                bytes_per_line = scaled_width * 2
+                image_format = QImage.Format.Format_Grayscale16
+            else:
+                bytes_per_line = scaled_width
+                image_format = QImage.Format.Format_Grayscale8
+            self._display_qimage = QImage(self._display_buf.data, scaled_width, scaled_height, bytes_per_line, image_format)
+        
+        """Calculate the offset to center the image"""
+        offset_x = (container_size.width() - scaled_width) // 2
+        offset_y = (container_size.height() - scaled_height) // 2
+        
+        """Calculate the scale factors"""
+        scale_factor_x = scaled_width / width
+        scale_factor_y = scaled_height / height
+        
+        """Update the ROI drawing parameters, skipping the update when the geometry has not actually changed"""
+        roi_geometry = (
+            scale_factor_x, scale_factor_y, 
+            offset_x, offset_y,
+            scaled_width, scaled_height,
+            width, height
+        )
+        if roi_geometry != self._roi_geometry:
+            self.draw_roi.update_scale_and_offset(*roi_geometry)
+            self.draw_roi.draw_rectangle(self.window.image_container)
+            self._roi_geometry = roi_geometry
+        
+        """Position the image so it is centered in the view"""
+        self.window.image_container.pixmap_item.setPos(offset_x, offset_y)
+        
+        self.original_image_size = (width, height)
+        self._size_dirty = False
+    
+    def _get_bit_depth(self):
+        
+        """Get the number of significant bits per pixel from the camera, e.g. 12 from XI_BPP_12."""
+        bit_depth = self.camera_control.call_camera_command("image_data_bit_depth", "get")
+        try:
+            return int(str(bit_depth).rsplit('_', 1)[-1])
+        except ValueError:
+            return 16
     
     def handle_apply_roi(self):
         
@@ -211,6 +269,7 @@ class UIMethods(QObject):
             
             """Clear the  rectangle"""
             self.draw_roi.current_rect = None
+            self.draw_roi.draw_rectangle(self.window.image_container)
         else:
             update_status("No ROI Selected", duration=2000)
     
@@ -218,18 +277,12 @@ class UIMethods(QObject):
         
         """Handle Reset ROI button click."""
         try:
-            """Update the ROI spinboxes to max values"""
-            self.window.roi_offset_x.setValue(0)
-            self.window.roi_offset_y.setValue(0)
-            time.sleep(0.05) # Wait for the offset to update
-            max_width = int(self.camera_control.call_camera_command("width_max", "get"))
-            max_height = int(self.camera_control.call_camera_command("height_max", "get"))
-            self.window.roi_width.setValue(max_width)
-            self.window.roi_height.setValue(max_height)
+            """Reset the camera ROI and spinboxes to the full sensor"""
+            self.control_manager.get_control("roi").reset_roi()
             
             """Clear the current rectangle"""
             self.draw_roi.current_rect = None
-            self.window.image_container.update()
+            self.draw_roi.draw_rectangle(self.window.image_container)
             
             """Update status bar"""
             self.status_bar_manager.update_on_control_change("roi")
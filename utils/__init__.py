@@ -5,4 +5,5 @@ Utility functions for the microTool project.
 from .status import update_status, set_main_window
 from .image import calc_img_hist
 from .system_info import get_computer_name
-__all__ = ['update_status', 'set_main_window', 'calc_img_hist', 'get_computer_name']
+from .logging_setup import start_logging, stop_logging
+__all__ = ['update_status', 'set_main_window', 'calc_img_hist', 'get_computer_name', 'start_logging', 'stop_logging']
@@ -4,27 +4,23 @@ Image processing utility functions.
 import cv2
 import numpy as np
 
-def calc_img_hist(window, image_data):
-    """Calculate and display histogram for image data."""
+def calc_img_hist(window, image_data, bit_depth=8):
+    """
+    Calculate and display histogram for image data.
+    image_data may be a strided view of the frame, it is never cast to float,
+    only the 256 bin counts are. 16-bit data holding bit_depth significant bits
+    is binned on its top 8 bits.
+    """
     if len(image_data.shape) == 3:
         image_data = cv2.cvtColor(image_data, cv2.COLOR_RGB2GRAY)
 
-    hist = cv2.calcHist([image_data], [0], None, [256], [0, 256])
-    window.hist_display.figure.clear()
-    ax = window.hist_display.figure.add_subplot(111)
-    ax.plot(hist, color='#97c1ff', linestyle='-', linewidth=0.5, marker='')
-    
-    # Fill the area under the histogram line
-    ax.fill_between(np.arange(256), hist[:, 0], color='#97c1ff', alpha=0.2)
-    
-    ax.set_yscale('log')
-    ax.set_xlim([0, 256])
-    ax.set_xticks([])
-    ax.set_yticks([])
-    for spine in ax.spines.values():
-        spine.set_visible(False)
-    ax.set_frame_on(False)
-    
-    window.hist_display.figure.patch.set_facecolor('#2f353c')
-    window.hist_display.figure.subplots_adjust(left=0, right=1, top=1, bottom=0)
-    window.hist_display.draw() 
\ No newline at end of file
+    if image_data.dtype == np.uint8:
+        # Counting 8-bit values directly is much faster than binning with edges
+        hist = np.bincount(image_data.ravel(), minlength=256)
+    elif image_data.dtype == np.uint16:
+        hist = np.bincount((image_data >> (bit_depth - 8)).ravel(), minlength=256)[:256]
+    else:
+        hist = cv2.calcHist([image_data], [0], None, [256], [0, 256])[:, 0]
+
+    # Plot on a log scale, log1p keeps empty bins at zero
+    window.hist_curve.setData(y=np.log1p(hist))
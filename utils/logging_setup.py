@@ -0,0 +1,54 @@
+"""
+Logging utility functions for the microTool project.
+Log records are queued by the calling thread and written out by a background listener,
+so logging from the camera thread never waits on console I/O.
+"""
+
+import logging
+import logging.handlers
+import queue
+
+# Background listener that writes queued log records, and the root handler that feeds it
+_listener = None
+_queue_handler = None
+
+def start_logging(level=logging.INFO):
+    """
+    Route all log records through a queue to a background console writer.
+    This should be called once when the application starts.
+    
+    Args:
+        level: Minimum level of records to log
+    
+    Example usage:
+        import logging
+        from utils import start_logging, stop_logging
+        
+        start_logging()
+        logging.getLogger(__name__).info("Camera stream started")
+        stop_logging()  # Flush remaining records on shutdown
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
+    
+    log_queue = queue.SimpleQueue()
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    root_logger.addHandler(_queue_handler)
+    
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(levelname)s: %(message)s"))
+    _listener = logging.handlers.QueueListener(log_queue, console_handler)
+    _listener.start()
+
+def stop_logging():
+    """Detach the queue from the root logger, then stop the background writer after flushing any queued log records."""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None